@@ -11,19 +11,26 @@ import os
 import shlex
 import sys
 
-import earthkit.data as ekd
-
+# Keep the imports of this module light, the models are listed and loaded
+# through .plugins, and .model (earthkit, numpy) is only imported by the models
 from .inputs import available_inputs
-from .model import Timer
-from .model import available_models
-from .model import load_model
 from .outputs import available_outputs
-
-ekd.settings.set("cache-policy", "user")
+from .timer import Timer
 
 LOG = logging.getLogger(__name__)
 
 
+def _parse_metadata(values):
+    metadata = {}
+    for kv in values:
+        # Values may contain '=', so only split on the first one
+        key, sep, value = kv.partition("=")
+        if not sep:
+            raise ValueError(f"--metadata expects KEY=VALUE, got '{kv}'")
+        metadata[key] = value
+    return metadata
+
+
 def _main(argv):
     parser = argparse.ArgumentParser()
 
@@ -134,10 +141,9 @@ def _main(argv):
         "--assets-sub-directory",
         help="Load assets from a subdirectory of --assets based on the name of the model.",
         action=argparse.BooleanOptionalAction,
+        default=False,
     )
 
-    parser.parse_args(["--no-assets-sub-directory"])
-
     parser.add_argument(
         "--assets-list",
         help="List the assets used by the model",
@@ -180,6 +186,15 @@ def _main(argv):
         action="append",
     )
 
+    parser.add_argument(
+        "--async-write",
+        help=(
+            "Encode and write the output in a background thread, overlapping it with inference."
+            " The arrays given to the writer are copied first, GPU tensors must be moved to the CPU by the model"
+        ),
+        action="store_true",
+    )
+
     parser.add_argument(
         "--num-threads",
         type=int,
@@ -215,6 +230,15 @@ def _main(argv):
         action="store_true",
     )
 
+    parser.add_argument(
+        "--ort-providers",
+        help=(
+            "Comma separated list of ONNX runtime execution providers to use, in order of preference."
+            " Only relevant for ONNX based models. Defaults to CUDA, then CPU."
+        ),
+        metavar="PROVIDERS",
+    )
+
     parser.add_argument(
         "--deterministic",
         help="Fail if GPU is not available",
@@ -235,6 +259,8 @@ def _main(argv):
     )
 
     if all(arg not in ("--models", "--version") for arg in argv):
+        from .plugins import available_models
+
         parser.add_argument(
             "model",
             metavar="MODEL",
@@ -271,12 +297,18 @@ def _main(argv):
                 sys.exit(0)
             print(f"Models available on remote server {api.url}")
         else:
+            from .plugins import available_models
+
             models = available_models()
 
         for p in sorted(models):
             print(p)
         sys.exit(0)
 
+    if args.requests_extra:
+        if not args.retrieve_requests and not args.archive_requests:
+            parser.error("You need to specify --retrieve-requests or --archive-requests")
+
     if args.assets_sub_directory:
         args.assets = os.path.join(args.assets, args.model)
 
@@ -292,30 +324,34 @@ def _main(argv):
             format="%(asctime)s %(levelname)s %(message)s",
         )
 
-    if args.metadata is None:
-        args.metadata = []
-
-    args.metadata = dict(kv.split("=") for kv in args.metadata)
+    try:
+        metadata = _parse_metadata(args.metadata or [])
+    except ValueError as e:
+        parser.error(str(e))
 
     if args.expver is not None:
-        args.metadata["expver"] = args.expver
+        metadata["expver"] = args.expver
 
     if args.class_ is not None:
-        args.metadata["class"] = args.class_
+        metadata["class"] = args.class_
 
-    if args.requests_extra:
-        if not args.retrieve_requests and not args.archive_requests:
-            parser.error("You need to specify --retrieve-requests or --archive-requests")
+    args.metadata = metadata
 
     run(vars(args), unknownargs)
 
 
 def run(cfg: dict, model_args: list):
+    import earthkit.data as ekd
+
+    ekd.settings.set("cache-policy", "user")
+
     if cfg["remote_execution"]:
         from .remote import RemoteModel
 
         model = RemoteModel(**cfg, model_args=model_args)
     else:
+        from .plugins import load_model
+
         model = load_model(cfg["model"], **cfg, model_args=model_args)
 
     if cfg["fields"]:
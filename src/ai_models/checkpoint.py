@@ -31,22 +31,17 @@ class UnpicklerWrapper(pickle.Unpickler):
 
 
 def tidy(x):
+    # Most of the objects are leaves, so check for them first
+    if not isinstance(x, (dict, list, tuple)):
+        return x
+
     if isinstance(x, dict):
         return {k: tidy(v) for k, v in x.items()}
 
     if isinstance(x, list):
         return [tidy(v) for v in x]
 
-    if isinstance(x, tuple):
-        return tuple([tidy(v) for v in x])
-
-    if x is None:
-        return None
-
-    if isinstance(x, (int, float, str, bool)):
-        return x
-
-    return x
+    return tuple([tidy(v) for v in x])
 
 
 def peek(path):
@@ -58,9 +53,8 @@ def peek(path):
                     raise Exception(f"Found two data.pkl files in {path}: {data_pkl} and {b}")
                 data_pkl = b
 
-    LOG.info(f"Found data.pkl at {data_pkl}")
+        LOG.info(f"Found data.pkl at {data_pkl}")
 
-    with zipfile.ZipFile(path, "r") as f:
-        unpickler = UnpicklerWrapper(f.open(data_pkl, "r"))
-        x = tidy(unpickler.load())
-        return tidy(x)
+        with f.open(data_pkl, "r") as g:
+            unpickler = UnpicklerWrapper(g)
+            return tidy(unpickler.load())
@@ -6,12 +6,9 @@
 # nor does it submit to any jurisdiction.
 
 import logging
-from functools import cached_property
+from functools import cache
 
-import earthkit.data as ekd
-import earthkit.regrid as ekr
-import entrypoints
-from earthkit.data.indexing.fieldlist import FieldArray
+from ..plugins import entry_points
 
 LOG = logging.getLogger(__name__)
 
@@ -20,8 +17,9 @@ def get_input(name, *args, **kwargs):
     return available_inputs()[name].load()(*args, **kwargs)
 
 
+@cache
 def available_inputs():
     result = {}
-    for e in entrypoints.get_group_all("ai_models.input"):
+    for e in entry_points("ai_models.input"):
         result[e.name] = e
     return result
@@ -6,12 +6,20 @@
 # nor does it submit to any jurisdiction.
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 
 import earthkit.data as ekd
 
 LOG = logging.getLogger(__name__)
 
+# Maximum number of concurrent retrievals (one per date/time and type of level),
+# shared by the surface, pressure and model level fields
+FETCH_WORKERS = int(os.environ.get("AI_MODELS_FETCH_WORKERS", "8"))
+FETCH_SLOTS = threading.BoundedSemaphore(FETCH_WORKERS)
+
 
 class RequestBasedInput:
     def __init__(self, owner, **kwargs):
@@ -22,6 +30,29 @@ class RequestBasedInput:
         self.owner.patch_retrieve_request(r)
         return r
 
+    @cached_property
+    def _datetimes(self):
+        # Shared by the surface, pressure and model level requests
+        return list(self.owner.datetimes())
+
+    def _load_multi(self, load_source, **kwargs):
+        # One request per date/time. They are independent, so they
+        # are retrieved concurrently and combined in the original order
+        requests = [self._patch(date=date, time=time, **kwargs) for date, time in self._datetimes]
+
+        def load(r):
+            with FETCH_SLOTS:
+                return load_source(**r)
+
+        workers = min(FETCH_WORKERS, len(requests))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                sources = list(executor.map(load, requests))
+        else:
+            sources = [load(r) for r in requests]
+
+        return ekd.from_source("multi", sources)
+
     @cached_property
     def fields_sfc(self):
         param = self.owner.param_sfc
@@ -30,21 +61,12 @@ class RequestBasedInput:
 
         LOG.info(f"Loading surface fields from {self.WHERE}")
 
-        return ekd.from_source(
-            "multi",
-            [
-                self.sfc_load_source(
-                    **self._patch(
-                        date=date,
-                        time=time,
-                        param=param,
-                        grid=self.owner.grid,
-                        area=self.owner.area,
-                        **self.owner.retrieve,
-                    )
-                )
-                for date, time in self.owner.datetimes()
-            ],
+        return self._load_multi(
+            self.sfc_load_source,
+            param=param,
+            grid=self.owner.grid,
+            area=self.owner.area,
+            **self.owner.retrieve,
         )
 
     @cached_property
@@ -54,21 +76,12 @@ class RequestBasedInput:
             return ekd.from_source("empty")
 
         LOG.info(f"Loading pressure fields from {self.WHERE}")
-        return ekd.from_source(
-            "multi",
-            [
-                self.pl_load_source(
-                    **self._patch(
-                        date=date,
-                        time=time,
-                        param=param,
-                        level=level,
-                        grid=self.owner.grid,
-                        area=self.owner.area,
-                    )
-                )
-                for date, time in self.owner.datetimes()
-            ],
+        return self._load_multi(
+            self.pl_load_source,
+            param=param,
+            level=level,
+            grid=self.owner.grid,
+            area=self.owner.area,
         )
 
     @cached_property
@@ -78,23 +91,19 @@ class RequestBasedInput:
             return ekd.from_source("empty")
 
         LOG.info(f"Loading model fields from {self.WHERE}")
-        return ekd.from_source(
-            "multi",
-            [
-                self.ml_load_source(
-                    **self._patch(
-                        date=date,
-                        time=time,
-                        param=param,
-                        level=level,
-                        grid=self.owner.grid,
-                        area=self.owner.area,
-                    )
-                )
-                for date, time in self.owner.datetimes()
-            ],
+        return self._load_multi(
+            self.ml_load_source,
+            param=param,
+            level=level,
+            grid=self.owner.grid,
+            area=self.owner.area,
         )
 
     @cached_property
     def all_fields(self):
-        return self.fields_sfc + self.fields_pl + self.fields_ml
+        # The surface, pressure and model level retrievals are independent,
+        # so we run them concurrently. Each cached property is only evaluated
+        # by one of the workers, so there is no risk of retrieving twice.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            sfc, pl, ml = [executor.submit(getattr, self, name) for name in ("fields_sfc", "fields_pl", "fields_ml")]
+            return sfc.result() + pl.result() + ml.result()
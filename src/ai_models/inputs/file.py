@@ -9,7 +9,6 @@ import logging
 from functools import cached_property
 
 import earthkit.data as ekd
-import entrypoints
 
 LOG = logging.getLogger(__name__)
 
@@ -34,14 +33,3 @@ class FileInput:
     @cached_property
     def all_fields(self):
         return ekd.from_source("file", self.file)
-
-
-def get_input(name, *args, **kwargs):
-    return available_inputs()[name].load()(*args, **kwargs)
-
-
-def available_inputs():
-    result = {}
-    for e in entrypoints.get_group_all("ai_models.input"):
-        result[e.name] = e
-    return result
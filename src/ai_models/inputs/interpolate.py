@@ -6,6 +6,10 @@
 # nor does it submit to any jurisdiction.
 
 import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import earthkit.data as ekd
 import earthkit.regrid as ekr
@@ -14,6 +18,48 @@ from earthkit.data.core.temporary import temp_file
 
 LOG = logging.getLogger(__name__)
 
+INTERPOLATE_WORKERS = min(8, os.cpu_count() or 1)
+
+
+# Interpolation matrices, by source and target grids. The requests of the
+# different dates are loaded in parallel, so they may look them up concurrently
+MATRICES = {}
+MATRICES_LOCK = threading.Lock()
+
+
+def _matrix(source, grid):
+    # ekr.interpolate() loads the interpolation matrix from disk for every field,
+    # so we keep it in memory, as all the fields of a request share the same grids.
+    # This uses an internal function of earthkit-regrid, hence the fallback.
+    key = (_hashable(source), _hashable(grid))
+
+    with MATRICES_LOCK:
+        if key in MATRICES:
+            return MATRICES[key]
+
+        try:
+            from earthkit.regrid.db import find
+        except ImportError:
+            return None
+
+        try:
+            matrix, shape = find(dict(grid=source), dict(grid=grid), "linear")
+        except Exception:
+            # The internal API differs between versions of earthkit-regrid.
+            # Failures are not cached, as they may be transient (e.g. network)
+            LOG.debug("Cannot cache the interpolation matrix, using ekr.interpolate()", exc_info=True)
+            return None
+
+        if matrix is None:
+            return None
+
+        MATRICES[key] = (matrix, shape)
+        return MATRICES[key]
+
+
+def _hashable(grid):
+    return tuple(grid) if isinstance(grid, list) else grid
+
 
 class Interpolate:
     def __init__(self, grid, source, metadata):
@@ -21,21 +67,45 @@ class Interpolate:
         self.source = list(source) if isinstance(source, tuple) else source
         self.metadata = metadata
 
+    def interpolate(self, values, found):
+        if found is None:
+            return ekr.interpolate(values, dict(grid=self.source), dict(grid=self.grid))
+
+        matrix, shape = found
+        return (matrix @ values.reshape(-1, 1)).reshape(shape)
+
     def __call__(self, ds):
         tmp = temp_file()
 
         out = ekd.new_grib_output(tmp.path)
 
-        result = []
-        for f in tqdm.tqdm(ds, delay=0.5, desc="Interpolating", leave=False):
-            data = ekr.interpolate(f.to_numpy(), dict(grid=self.source), dict(grid=self.grid))
-            out.write(data, template=f, **self.metadata)
+        # The sparse products release the GIL, so fields are interpolated by a pool of
+        # threads, while this thread decodes and encodes them in order. The fallback to
+        # ekr.interpolate() may download files, so it is not run concurrently.
+        found = _matrix(self.source, self.grid)
+        workers = INTERPOLATE_WORKERS if found is not None else 1
+
+        pending = deque()
+
+        def write():
+            f, future = pending.popleft()
+            out.write(future.result(), template=f, **self.metadata)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for f in tqdm.tqdm(ds, delay=0.5, desc="Interpolating", leave=False):
+                pending.append((f, executor.submit(self.interpolate, f.to_numpy(), found)))
+                # Limit the number of fields held in memory
+                if len(pending) > workers:
+                    write()
+
+            while pending:
+                write()
 
         out.close()
 
         result = ekd.from_source("file", tmp.path)
         result._tmp = tmp
 
-        print("Interpolated data", tmp.path)
+        LOG.debug("Interpolated data: %s", tmp.path)
 
         return result
@@ -22,15 +22,15 @@ class MarsInput(RequestBasedInput):
 
     def pl_load_source(self, **kwargs):
         kwargs["levtype"] = "pl"
-        logging.debug("load source mars %s", kwargs)
+        LOG.debug("load source mars %s", kwargs)
         return ekd.from_source("mars", kwargs)
 
     def sfc_load_source(self, **kwargs):
         kwargs["levtype"] = "sfc"
-        logging.debug("load source mars %s", kwargs)
+        LOG.debug("load source mars %s", kwargs)
         return ekd.from_source("mars", kwargs)
 
     def ml_load_source(self, **kwargs):
         kwargs["levtype"] = "ml"
-        logging.debug("load source mars %s", kwargs)
+        LOG.debug("load source mars %s", kwargs)
         return ekd.from_source("mars", kwargs)
@@ -8,6 +8,7 @@
 import itertools
 import logging
 import os
+import threading
 
 import earthkit.data as ekd
 from earthkit.data.core.temporary import temp_file
@@ -54,6 +55,28 @@ def _identity(x):
     return x
 
 
+# The requests for the different dates are retrieved in parallel
+# threads, so the constants must only be downloaded by one of them
+CONSTANTS_LOCK = threading.Lock()
+
+
+def _constants_path(resol):
+    cachedir = os.path.expanduser("~/.cache/ai-models")
+    constants_url = CONSTANTS_URL.format(resol=resol)
+    path = os.path.join(cachedir, os.path.basename(constants_url))
+
+    with CONSTANTS_LOCK:
+        if not os.path.exists(path):
+            os.makedirs(cachedir, exist_ok=True)
+            logging.info("Downloading %s to %s", constants_url, path)
+            # Other processes may be downloading the same file
+            tmp = f"{path}.{os.getpid()}.tmp"
+            download(constants_url, tmp)
+            os.replace(tmp, path)
+
+    return path
+
+
 class OpenDataInput(RequestBasedInput):
     WHERE = "OPENDATA"
 
@@ -128,21 +151,7 @@ class OpenDataInput(RequestBasedInput):
                 " not available in ECMWF open data, using constants.grib2 instead"
             )
 
-        cachedir = os.path.expanduser("~/.cache/ai-models")
-        constants_url = CONSTANTS_URL.format(resol=request["resol"])
-        basename = os.path.basename(constants_url)
-
-        if not os.path.exists(cachedir):
-            os.makedirs(cachedir)
-
-        path = os.path.join(cachedir, basename)
-
-        if not os.path.exists(path):
-            logging.info("Downloading %s to %s", constants_url, path)
-            download(constants_url, path + ".tmp")
-            os.rename(path + ".tmp", path)
-
-        ds = ekd.from_source("file", path)
+        ds = ekd.from_source("file", _constants_path(request["resol"]))
         ds = ds.sel(param=constant_params)
 
         tmp = temp_file()
@@ -16,8 +16,20 @@ LOG = logging.getLogger(__name__)
 
 CHECKED = set()
 
+# Results of _init_recenter(), by grid definition section
+RECENTER = {}
+
 
 def _init_recenter(ds, f):
+    # All the fields of a retrieval share the same grid, so the geometry is
+    # only read and checked once, instead of decoding nine keys per field
+    key = f.metadata("md5GridSection")
+    if key not in RECENTER:
+        RECENTER[key] = _recenter_parameters(ds, f)
+    return RECENTER[key]
+
+
+def _recenter_parameters(ds, f):
 
     # For now, we only support the 0.25x0.25 grid from OPENDATA (centered on the greenwich meridian)
 
@@ -67,22 +79,37 @@ def _init_recenter(ds, f):
     return (shape, roll, axis, dict(longitudeOfFirstGridPointInDegrees=0, longitudeOfLastGridPointInDegrees=359.75))
 
 
+def _roll(data, roll, out):
+    # Same as np.roll(data, roll, axis=1), without allocating a new array
+    n = -roll % data.shape[1]
+    out[:, : data.shape[1] - n] = data[:, n:]
+    out[:, data.shape[1] - n :] = data[:, :n]
+    return out
+
+
 def recenter(ds):
 
     tmp = temp_file()
 
     out = ekd.new_grib_output(tmp.path)
 
+    # The fields are written one at a time, so they can share the same buffer
+    rolled = None
+
     for f in tqdm.tqdm(ds, delay=0.5, desc="Recentering", leave=False):
 
         shape, roll, axis, metadata = _init_recenter(ds, f)
+        assert axis == 1, axis
 
         data = f.to_numpy()
         assert data.shape == shape, (data.shape, shape)
 
-        data = np.roll(data, roll, axis=axis)
+        if rolled is None or rolled.shape != data.shape or rolled.dtype != data.dtype:
+            rolled = np.empty_like(data)
+
+        _roll(data, roll, rolled)
 
-        out.write(data, template=f, **metadata)
+        out.write(rolled, template=f, **metadata)
 
     out.close()
 
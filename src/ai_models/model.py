@@ -7,51 +7,104 @@
 
 import base64
 import datetime
+import io
 import json
 import logging
 import os
 import sys
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from functools import cached_property
 
 import earthkit.data as ekd
-import entrypoints
 import numpy as np
 from earthkit.data.utils.humanize import seconds
-from multiurl import download
+from multiurl import Downloader
 
 from .checkpoint import peek
 from .inputs import get_input
+from .outputs import BackgroundWriter
 from .outputs import get_output
+from .plugins import available_models  # noqa: F401
+from .plugins import load_model  # noqa: F401
 from .stepper import Stepper
+from .timer import Timer
 
 LOG = logging.getLogger(__name__)
 
+# ONNX runtime execution providers, in order of preference
+# Other providers (TensorRT, ROCm, OpenVINO, CoreML...) can be selected with --ort-providers.
+# They are not used by default, as they may change the precision of the results, and
+# onnxruntime-gpu reports TensorRT as available even when libnvinfer is not installed.
+ORT_PROVIDERS = (
+    "CUDAExecutionProvider",
+    "CPUExecutionProvider",
+)
 
-class Timer:
-    def __init__(self, title):
-        self.title = title
-        self.start = time.time()
+# The order of the values of these keys is meaningful
+UNSORTED_KEYS = frozenset(("area", "grid", "frame", "rotation", "bitmap"))
 
-    def __enter__(self):
-        return self
 
-    def __exit__(self, *args):
-        elapsed = time.time() - self.start
-        LOG.info("%s: %s.", self.title, seconds(elapsed))
+def _owned(value):
+    # A copy of the arrays (numpy, torch CPU tensors...) given to Model.write()
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if hasattr(value, "__array__") and not isinstance(value, np.generic):
+        return np.array(value, copy=True)
+    return value
+
+
+def _partial_download(path, headers):
+    # multiurl appends to a partial download without checking it, so an interrupted
+    # download is only continued if it is the beginning of the same version of the file.
+    # Returns "complete", "resume" or "restart".
+    if not os.path.exists(path) or not os.path.exists(path + ".etag"):
+        return "restart"
+
+    # The content-length of an encoded body is not the size of the file
+    if "content-length" not in headers or headers.get("content-encoding") is not None:
+        return "restart"
+
+    with open(path + ".etag") as f:
+        if f.read() != headers.get("etag"):
+            return "restart"
+
+    try:
+        size = int(headers["content-length"])
+    except ValueError:
+        return "restart"
+
+    done = os.path.getsize(path)
+    if done == size:
+        return "complete"
+
+    if done < size:
+        return "resume"
+
+    return "restart"
 
 
 class ArchiveCollector:
+    __slots__ = ("expect", "request", "seen")
+
     UNIQUE = {"date", "hdate", "time", "referenceDate", "type", "stream", "expver"}
 
     def __init__(self) -> None:
         self.expect = 0
         self.request = defaultdict(set)
+        self.seen = set()
 
     def add(self, field):
         self.expect += 1
-        for k, v in field.items():
+        for kv in field.items():
+            # Most values are the same for all fields, so skip the ones already recorded
+            if kv in self.seen:
+                continue
+            self.seen.add(kv)
+
+            k, v = kv
             self.request[k].add(str(v))
             if k in self.UNIQUE:
                 if len(self.request[k]) > 1:
@@ -70,6 +123,9 @@ class Model:
     param_level_pl = ([], [])  # param, level
     param_sfc = []  # param
 
+    ort_providers = None  # Override ORT_PROVIDERS, comma separated
+    async_write = False  # Write the output from a background thread
+
     def __init__(self, input, output, download_assets, **kwargs):
         self.input = get_input(input, self, **kwargs)
         self.output = get_output(output, self, **kwargs)
@@ -97,8 +153,10 @@ class Model:
         if download_assets:
             self.download_assets(**kwargs)
 
-        self.archiving = defaultdict(ArchiveCollector)
-        self.created = time.time()
+        self.archiving = {}
+        self._datetimes_cache = {}
+        self.writer = BackgroundWriter(self._write) if self.async_write else None
+        self.created = time.monotonic()
 
     @cached_property
     def fields_pl(self):
@@ -117,6 +175,16 @@ class Model:
         return self.input.all_fields
 
     def write(self, *args, **kwargs):
+        if self.writer is None:
+            self._write(*args, **kwargs)
+            return
+
+        # The caller may reuse its arrays as soon as we return
+        args = [_owned(a) for a in args]
+        kwargs = {k: _owned(v) for k, v in kwargs.items()}
+        self.writer.submit(*args, **kwargs)
+
+    def _write(self, *args, **kwargs):
         self.collect_archive_requests(
             self.output.write(*args, **kwargs, **self.grib_extra_metadata),
         )
@@ -129,13 +197,20 @@ class Model:
                 # does not return always return recently set keys
                 handle = handle.clone()
 
-            self.archiving[path].add(handle.as_namespace("mars"))
+            collector = self.archiving.get(path)
+            if collector is None:
+                collector = self.archiving[path] = ArchiveCollector()
+            collector.add(handle.as_namespace("mars"))
 
     def finalise(self):
+        if self.writer is not None:
+            self.writer.close()
+
         self.output.flush()
 
         if self.archive_requests:
             with open(self.archive_requests, "w") as f:
+                text = io.StringIO()
                 json_requests = []
 
                 for path, archive in self.archiving.items():
@@ -148,7 +223,9 @@ class Model:
                     if self.json:
                         json_requests.append(request)
                     else:
-                        self._print_request("archive", request, file=f)
+                        self._print_request("archive", request, file=text)
+
+                f.write(text.getvalue())
 
                 if json_requests:
 
@@ -166,20 +243,60 @@ class Model:
                     )
 
     def download_assets(self, **kwargs):
-        for file in self.download_files:
-            asset = os.path.realpath(os.path.join(self.assets, file))
-            if not os.path.exists(asset):
-                os.makedirs(os.path.dirname(asset), exist_ok=True)
-                LOG.info("Downloading %s", asset)
-                download(self.download_url.format(file=file), asset + ".download")
-                os.rename(asset + ".download", asset)
+        missing = [file for file in self.download_files if not os.path.exists(self._asset_path(file))]
+        if not missing:
+            return
+
+        # Assets are independent, so they are downloaded concurrently.
+        # A failure does not cancel the other downloads.
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+            futures = [(file, executor.submit(self._download_asset, file)) for file in missing]
+
+        errors = []
+        for file, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                LOG.error("Failed to download %s: %s", file, e)
+                errors.append(e)
+
+        if errors:
+            raise errors[0]
+
+    def _asset_path(self, file):
+        return os.path.realpath(os.path.join(self.assets, file))
+
+    def _download_asset(self, file):
+        asset = self._asset_path(file)
+        os.makedirs(os.path.dirname(asset), exist_ok=True)
+        LOG.info("Downloading %s", asset)
+
+        partial = asset + ".download"
+        downloader = Downloader(self.download_url.format(file=file), resume_transfers=True)
+        headers = downloader.headers() if hasattr(downloader, "headers") else {}
+
+        state = _partial_download(partial, headers)
+        LOG.debug("%s: %s", partial, state)
+
+        if state == "restart":
+            for path in (partial, partial + ".etag"):
+                if os.path.exists(path):
+                    os.unlink(path)
+            # Remember which version of the file is being downloaded
+            if headers.get("etag"):
+                with open(partial + ".etag", "w") as f:
+                    f.write(headers["etag"])
+
+        if state != "complete":
+            downloader.download(partial)
+
+        os.replace(partial, asset)
+        if os.path.exists(partial + ".etag"):
+            os.unlink(partial + ".etag")
 
     @property
     def asset_files(self, **kwargs):
-        result = []
-        for file in self.download_files:
-            result.append(os.path.realpath(os.path.join(self.assets, file)))
-        return result
+        return [self._asset_path(file) for file in self.download_files]
 
     @cached_property
     def device(self):
@@ -214,31 +331,113 @@ class Model:
         torch.backends.cudnn.deterministic = True
         torch.use_deterministic_algorithms(True)
 
+    @cached_property
+    def provider_options(self):
+        # See https://onnxruntime.ai/docs/execution-providers/CUDA-ExecutionProvider.html
+        cuda = dict(
+            device_id=0,
+            arena_extend_strategy="kNextPowerOfTwo",
+            cudnn_conv_algo_search="HEURISTIC",
+            do_copy_in_default_stream=True,
+        )
+
+        gpu_mem_limit = os.environ.get("AI_MODELS_GPU_MEM_LIMIT")
+        if gpu_mem_limit:
+            cuda["gpu_mem_limit"] = int(gpu_mem_limit)
+
+        # Building a TensorRT engine is slow, so we keep them in the user's cache,
+        # as the assets directory may be shared and read-only
+        tensorrt = dict(
+            trt_engine_cache_enable=True,
+            trt_engine_cache_path=os.path.expanduser("~/.cache/ai-models/trt-cache"),
+            trt_max_workspace_size=4 << 30,
+        )
+
+        # FP16 is faster but changes the results, so it must be asked for
+        if os.environ.get("AI_MODELS_TRT_FP16"):
+            tensorrt["trt_fp16_enable"] = True
+
+        return {
+            "TensorrtExecutionProvider": tensorrt,
+            "CUDAExecutionProvider": cuda,
+        }
+
     @cached_property
     def providers(self):
-        import onnxruntime as ort
+        # The result must be given to the constructor of the session, i.e.
+        # ort.InferenceSession(path, providers=self.providers), as providers
+        # set afterwards with set_providers() may silently fall back to CPU.
+        device, available_providers = _ort_device_and_providers()
+
+        preferred = ORT_PROVIDERS
+        if self.ort_providers:
+            preferred = [n.strip() for n in self.ort_providers.split(",")]
 
-        available_providers = ort.get_available_providers()
         providers = []
-        for n in ["CUDAExecutionProvider", "CPUExecutionProvider"]:
+        for n in preferred:
             if n in available_providers:
                 providers.append(n)
+            elif self.ort_providers:
+                LOG.warning("ONNXRuntime provider %s is not available", n)
 
         LOG.info(
             "Using device '%s'. The speed of inference depends greatly on the device.",
-            ort.get_device(),
+            device,
         )
 
         if self.only_gpu:
-            assert isinstance(ort.get_device(), str)
-            if ort.get_device() == "CPU":
+            assert isinstance(device, str)
+            if device == "CPU":
                 raise RuntimeError("GPU is not available")
 
-            providers = ["CUDAExecutionProvider"]
+            providers = [n for n in providers if n != "CPUExecutionProvider"]
 
         LOG.info("ONNXRuntime providers: %s", providers)
 
-        return providers
+        if "TensorrtExecutionProvider" in providers:
+            os.makedirs(self.provider_options["TensorrtExecutionProvider"]["trt_engine_cache_path"], exist_ok=True)
+
+        return [(n, self.provider_options[n]) if n in self.provider_options else n for n in providers]
+
+    @cached_property
+    def session_options(self):
+        # To be used as ort.InferenceSession(path, sess_options=self.session_options, providers=self.providers)
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.enable_mem_pattern = True
+        options.enable_cpu_mem_arena = True
+        options.intra_op_num_threads = self.num_threads
+
+        return options
+
+    def make_io_binding(self, session, shapes, dtype=np.float32):
+        # Allocate the inputs and outputs of the session on the device once, so that
+        # session.run_with_iobinding(binding) does not copy them to and from the host
+        # at every step. `shapes` maps the names of the inputs and outputs to their shapes.
+        # Use values[name].update_inplace(array) to set an input and values[name].numpy()
+        # to read an output. Call this again only if the shapes change.
+        import onnxruntime as ort
+
+        device = "cpu"
+        for p in session.get_providers():
+            if p in ("TensorrtExecutionProvider", "CUDAExecutionProvider"):
+                device = "cuda"
+                break
+
+        binding = session.io_binding()
+        values = {}
+
+        for node in session.get_inputs():
+            values[node.name] = ort.OrtValue.ortvalue_from_shape_and_type(shapes[node.name], dtype, device, 0)
+            binding.bind_ortvalue_input(node.name, values[node.name])
+
+        for node in session.get_outputs():
+            values[node.name] = ort.OrtValue.ortvalue_from_shape_and_type(shapes[node.name], dtype, device, 0)
+            binding.bind_ortvalue_output(node.name, values[node.name])
+
+        return binding, values
 
     def timer(self, title):
         return Timer(title)
@@ -246,31 +445,21 @@ class Model:
     def stepper(self, step):
         # We assume that we call this method only once
         # just before the first iteration.
-        elapsed = time.time() - self.created
+        elapsed = time.monotonic() - self.created
         LOG.info("Model initialisation: %s", seconds(elapsed))
         return Stepper(step, self.lead_time)
 
     def _datetimes(self, dates):
-        date = self.date
-        assert isinstance(date, int)
-        if date <= 0:
-            date = datetime.datetime.utcnow() + datetime.timedelta(days=date)
-            date = date.year * 10000 + date.month * 100 + date.day
-
-        time = self.time
-        assert isinstance(time, int)
-        if time < 100:
-            time *= 100
-        # assert time in (0, 600, 1200, 1800), time
-
         lagged = self.lagged
         if not lagged:
             lagged = [0]
 
+        lagged = [datetime.timedelta(hours=lag) for lag in lagged]
+
         result = []
         for basedate in dates:
             for lag in lagged:
-                date = basedate + datetime.timedelta(hours=lag)
+                date = basedate + lag
                 result.append(
                     (
                         date.year * 10000 + date.month * 100 + date.day,
@@ -281,6 +470,13 @@ class Model:
         return result
 
     def datetimes(self, step=0):
+        # The result only depends on the configuration, so it is computed once per step.
+        # This also ensures that relative dates are resolved only once.
+        if step not in self._datetimes_cache:
+            self._datetimes_cache[step] = self._compute_datetimes(step)
+        return list(self._datetimes_cache[step])
+
+    def _compute_datetimes(self, step):
         if self.staging_dates:
             assert step == 0, step
             dates = []
@@ -332,19 +528,15 @@ class Model:
             if not isinstance(v, (list, tuple, set)):
                 v = [v]
 
-            if k in ("area", "grid", "frame", "rotation", "bitmap"):
-                v = [str(_) for _ in v]
-            else:
-                v = [str(_) for _ in sorted(v)]
+            if k not in UNSORTED_KEYS:
+                v = sorted(v)
 
-            v = "/".join(v)
-            r.append(f"{k}={v}")
+            r.append(f"{k}={'/'.join(map(str, v))}")
 
         r = ",\n   ".join(r)
-        print(r, file=file)
-        print(file=file)
+        print(r, end="\n\n", file=file)
 
-    @property
+    @cached_property
     def _requests_extra(self):
         if not self.requests_extra:
             return {}
@@ -359,8 +551,11 @@ class Model:
             print(json.dumps(requests, indent=4))
             return
 
+        text = io.StringIO()
         for r in requests:
-            self._print_request("retrieve", r)
+            self._print_request("retrieve", r, file=text)
+
+        print(text.getvalue(), end="")
 
     def _requests_unfiltered(self):
         result = []
@@ -607,12 +802,10 @@ class Model:
                         )
 
 
-def load_model(name, **kwargs):
-    return available_models()[name].load()(**kwargs)
-
+@cache
+def _ort_device_and_providers():
+    # Importing onnxruntime is slow, so we only do it when a model needs it,
+    # and only probe the device and the providers once per process
+    import onnxruntime as ort
 
-def available_models():
-    result = {}
-    for e in entrypoints.get_group_all("ai_models.model"):
-        result[e.name] = e
-    return result
+    return ort.get_device(), ort.get_available_providers()
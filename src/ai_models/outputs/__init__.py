@@ -7,12 +7,13 @@
 
 import itertools
 import logging
+import queue
+import threading
 import warnings
+from functools import cache
 from functools import cached_property
 
-import earthkit.data as ekd
-import entrypoints
-import numpy as np
+from ..plugins import entry_points
 
 LOG = logging.getLogger(__name__)
 
@@ -50,6 +51,8 @@ class GribOutputBase(Output):
 
     @cached_property
     def output(self):
+        import earthkit.data as ekd
+
         return ekd.new_grib_output(
             self.path,
             split_output=True,
@@ -62,11 +65,13 @@ class GribOutputBase(Output):
             handle, path = self.output.write(data, *args, **kwargs)
 
         except Exception:
-            if data is not None:
+            import numpy as np
+
+            # Single pass in the common case where all values are finite
+            if data is not None and not np.isfinite(data).all():
                 if np.isnan(data).any():
                     raise ValueError(f"NaN values found in field. args={args} kwargs={kwargs}")
-                if np.isinf(data).any():
-                    raise ValueError(f"Infinite values found in field. args={args} kwargs={kwargs}")
+                raise ValueError(f"Infinite values found in field. args={args} kwargs={kwargs}")
 
             options = {}
             options.update(self.grib_keys)
@@ -120,12 +125,15 @@ class NoneOutput(Output):
 
 
 class HindcastReLabel:
+    __slots__ = ("owner", "output", "hindcast_reference_year", "hindcast_reference_date", "checked")
+
     def __init__(self, owner, output, hindcast_reference_year=None, hindcast_reference_date=None, **kwargs):
         self.owner = owner
         self.output = output
         self.hindcast_reference_year = int(hindcast_reference_year) if hindcast_reference_year else None
         self.hindcast_reference_date = int(hindcast_reference_date) if hindcast_reference_date else None
         assert self.hindcast_reference_year is not None or self.hindcast_reference_date is not None
+        self.checked = False
 
     def write(self, *args, **kwargs):
         if "hdate" in kwargs:
@@ -163,7 +171,10 @@ class HindcastReLabel:
             kwargs["referenceDate"] = referenceDate
             kwargs["hdate"] = date
 
-        kwargs.setdefault("check", True)
+        # Reading back all the GRIB keys of every field is costly, so we
+        # only check the first field, or all of them when debugging
+        kwargs.setdefault("check", not self.checked or LOG.isEnabledFor(logging.DEBUG))
+        self.checked = True
 
         return self.output.write(*args, **kwargs)
 
@@ -172,6 +183,7 @@ class HindcastReLabel:
 
 
 class NoLabelling:
+    __slots__ = ("owner", "output")
 
     def __init__(self, owner, output, **kwargs):
         self.owner = owner
@@ -185,6 +197,42 @@ class NoLabelling:
         return self.output.flush(*args, **kwargs)
 
 
+class BackgroundWriter:
+    # Calls `write` from a separate thread, so that encoding and writing
+    # the fields overlaps with the computation of the next ones
+
+    def __init__(self, write, maxsize=4):
+        self.write = write
+        self.error = None
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+
+            if self.error is None:
+                args, kwargs = item
+                try:
+                    self.write(*args, **kwargs)
+                except Exception as e:
+                    self.error = e
+
+    def submit(self, *args, **kwargs):
+        if self.error is not None:
+            raise self.error
+        self.queue.put((args, kwargs))
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+
 def get_output(name, owner, *args, **kwargs):
     result = available_outputs()[name].load()(owner, *args, **kwargs)
     if kwargs.get("hindcast_reference_year") is not None or kwargs.get("hindcast_reference_date") is not None:
@@ -194,8 +242,9 @@ def get_output(name, owner, *args, **kwargs):
     return result
 
 
+@cache
 def available_outputs():
     result = {}
-    for e in entrypoints.get_group_all("ai_models.output"):
+    for e in entry_points("ai_models.output"):
         result[e.name] = e
     return result
@@ -0,0 +1,33 @@
+# (C) Copyright 2023 European Centre for Medium-Range Weather Forecasts.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import importlib.metadata
+from functools import cache
+
+
+def entry_points(group):
+    try:
+        return importlib.metadata.entry_points(group=group)
+    except TypeError:
+        # Python 3.9 does not support selecting the group
+        return importlib.metadata.entry_points().get(group, [])
+
+
+# These are kept out of model.py, so that listing the models
+# does not import earthkit, numpy or any of the models
+
+
+def load_model(name, **kwargs):
+    return available_models()[name].load()(**kwargs)
+
+
+@cache
+def available_models():
+    result = {}
+    for e in entry_points("ai_models.model"):
+        result[e.name] = e
+    return result
@@ -1,8 +1,10 @@
 import logging
 import os
+import random
 import sys
 import time
 from urllib.parse import urljoin
+from urllib.parse import urlparse
 
 import requests
 from multiurl import download
@@ -15,6 +17,11 @@ from .config import load_config
 
 LOG = logging.getLogger(__name__)
 
+# Delays between status requests, in seconds
+POLL_MIN_DELAY = 1
+POLL_MAX_DELAY = 30
+POLL_PROGRESS_DELAY = 5
+
 
 class BearerAuth(requests.auth.AuthBase):
     def __init__(self, token):
@@ -25,6 +32,23 @@ class BearerAuth(requests.auth.AuthBase):
         return r
 
 
+class FileUpload:
+    # Streams a file in large blocks. The length is known, so the body is not sent
+    # chunked, and the file is reopened on each iteration, so that a retried request
+    # sends the whole file again.
+    def __init__(self, path, blocksize=8 * 1024 * 1024):
+        self.path = path
+        self.blocksize = blocksize
+
+    def __len__(self):
+        return os.path.getsize(self.path)
+
+    def __iter__(self):
+        with open(self.path, "rb") as f:
+            while block := f.read(self.blocksize):
+                yield block
+
+
 class RemoteAPI:
     def __init__(
         self,
@@ -51,15 +75,19 @@ class RemoteAPI:
         LOG.info("Using remote server %s", self.url)
 
         self.auth = BearerAuth(self.token)
+
+        # Reuse the connection to the server for all the requests of a run
+        self.session = requests.Session()
+        self.session.auth = self.auth
         self.output_file = output_file
         self.input_file = input_file
         self._timeout = 300
+        self._statuses = {}  # href -> (etag, status)
 
     def run(self, cfg: dict):
         # upload file
-        with open(self.input_file, "rb") as file:
-            LOG.info("Uploading input file to remote server")
-            data = self._request(requests.post, "upload", data=file)
+        LOG.info("Uploading input file to remote server")
+        data = self._request(self.session.post, "upload", data=FileUpload(self.input_file))
 
         if data["status"] != "success":
             LOG.error(data["status"])
@@ -68,7 +96,7 @@ class RemoteAPI:
             sys.exit(1)
 
         # submit task
-        data = self._request(requests.post, data["href"], json=cfg)
+        data = self._request(self.session.post, data["href"], json=cfg)
 
         LOG.info("Inference request submitted")
 
@@ -84,8 +112,11 @@ class RemoteAPI:
         last_status = data["status"]
         pbar = None
 
+        # Poll often at first and after each change of status, then back off
+        delay = POLL_MIN_DELAY
+
         while True:
-            data = self._request(requests.get, data["href"])
+            data = self._status(data["href"])
 
             if data["status"] == "ready":
                 if pbar is not None:
@@ -102,6 +133,7 @@ class RemoteAPI:
             if data["status"] != last_status:
                 LOG.info("Request is %s", data["status"])
                 last_status = data["status"]
+                delay = POLL_MIN_DELAY
 
             if progress := data.get("progress"):
                 if pbar is None:
@@ -119,22 +151,37 @@ class RemoteAPI:
                     pbar.set_description(status.strip().capitalize())
                 pbar.update(progress.get("step", 0) - pbar.n)
 
-            time.sleep(5)
+            # The jitter avoids many clients started together polling in lockstep
+            time.sleep(delay * random.uniform(0.8, 1.2))
+
+            # Keep the progress bar responsive once the request is running
+            delay = min(delay * 1.5, POLL_PROGRESS_DELAY if pbar is not None else POLL_MAX_DELAY)
+
+        url = urljoin(self.url, data["href"])
 
-        download(urljoin(self.url, data["href"]), target=self.output_file)
+        # Reuse the connection if the result is served by the API server. The session
+        # is not given the token of the API for any other server (e.g. a signed URL).
+        session = None
+        if urlparse(url).netloc == urlparse(self.url).netloc:
+            session = self.session
+
+        download(url, target=self.output_file, session=session, chunk_size=4 * 1024 * 1024)
+
+        # No more requests are expected, so release the connection
+        self.session.close()
 
         LOG.debug("Result written to %s", self.output_file)
 
     def metadata(self, model, model_version, param) -> dict:
         if isinstance(param, str):
-            return self._request(requests.get, f"metadata/{model}/{model_version}/{param}")
+            return self._request(self.session.get, f"metadata/{model}/{model_version}/{param}")
         elif isinstance(param, (list, dict)):
-            return self._request(requests.post, f"metadata/{model}/{model_version}", json=param)
+            return self._request(self.session.post, f"metadata/{model}/{model_version}", json=param)
         else:
             raise ValueError("param must be a string, list, or dict with 'param' key.")
 
     def models(self):
-        results = self._request(requests.get, "models")
+        results = self._request(self.session.get, "models")
 
         if not isinstance(results, list):
             return []
@@ -142,19 +189,39 @@ class RemoteAPI:
         return results
 
     def patch_retrieve_request(self, cfg, request):
-        cfg["patchrequest"] = request
-        result = self._request(requests.post, "patch", json=cfg)
+        # Do not modify the configuration of the model, it is submitted later on
+        result = self._request(self.session.post, "patch", json=dict(cfg, patchrequest=request))
         if status := result.get("status"):
             LOG.error(status)
             sys.exit(1)
         return result
 
-    def _request(self, type, href, data=None, json=None, auth=None):
+    def _status(self, href):
+        # Send back the ETag of the previous status, so that the server can
+        # reply with a 304 and no body if the request has not progressed
+        headers = {}
+        if href in self._statuses:
+            headers["If-None-Match"] = self._statuses[href][0]
+
+        response = self._send(self.session.get, href, headers=headers)
+        if response.status_code == 304:
+            return self._statuses[href][1]
+
+        data = self._decode(response)
+        if etag := response.headers.get("ETag"):
+            self._statuses[href] = (etag, data)
+
+        return data
+
+    def _request(self, type, href, data=None, json=None):
+        return self._decode(self._send(type, href, data=data, json=json))
+
+    def _send(self, type, href, data=None, json=None, headers=None):
         response = robust(type, retry_after=30)(
             urljoin(self.url, href),
             json=json,
             data=data,
-            auth=self.auth,
+            headers=headers,
             timeout=self._timeout,
         )
 
@@ -162,6 +229,9 @@ class RemoteAPI:
             LOG.error("Unauthorized Access. Check your token.")
             sys.exit(1)
 
+        return response
+
+    def _decode(self, response):
         try:
             data = response.json()
 
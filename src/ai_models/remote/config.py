@@ -1,5 +1,6 @@
 import logging
 import os
+from functools import cache
 
 API_URL = "https://ai-models.ecmwf.int/api/v1/"
 
@@ -27,15 +28,28 @@ def create_config():
         LOG.error(e, exc_info=True)
 
 
-def load_config() -> dict:
-    from yaml import safe_load
+def _read_config():
+    from yaml import load
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
 
-    if not config_exists():
-        create_config()
+    with open(CONFIG_PATH, "rb") as f:
+        return load(f, Loader=SafeLoader) or {}
 
+
+# The configuration is only read once per process
+@cache
+def load_config() -> dict:
     try:
-        with open(CONFIG_PATH, "r") as f:
-            return safe_load(f) or {}
+        # The file normally exists, so we open it directly rather than checking first
+        try:
+            return _read_config()
+        except FileNotFoundError:
+            create_config()
+            return _read_config()
     except Exception as e:
         LOG.error(f"Failed to read config {CONFIG_PATH}")
         LOG.error(e, exc_info=True)
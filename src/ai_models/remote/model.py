@@ -80,13 +80,14 @@ class RemoteModel(Model):
         self._param.update(params)
 
     def get_parameter(self, name):
-        if (param := self._param.get(name)) is not None:
-            return param
-
-        _param = self.api.metadata(self.model, self.model_version, name)
-        self._param.update(_param)
-
-        return self._param.get(name)
+        if name not in self._param:
+            _param = self.api.metadata(self.model, self.model_version, name)
+            self._param.update(_param)
+            # Also remember the parameters the server does not know about,
+            # so that they are only requested once
+            self._param.setdefault(name, None)
+
+        return self._param[name]
 
     @cached_property
     def param_level_ml(self):
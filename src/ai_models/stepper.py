@@ -14,10 +14,12 @@ LOG = logging.getLogger(__name__)
 
 
 class Stepper:
+    __slots__ = ("step", "lead_time", "start", "last", "num_steps")
+
     def __init__(self, step, lead_time):
         self.step = step
         self.lead_time = lead_time
-        self.start = time.time()
+        self.start = time.monotonic()
         self.last = self.start
         self.num_steps = lead_time // step
         LOG.info("Starting inference for %s steps (%sh).", self.num_steps, lead_time)
@@ -26,24 +28,25 @@ class Stepper:
         return self
 
     def __call__(self, i, step):
-        now = time.time()
-        elapsed = now - self.start
-        speed = (i + 1) / elapsed
-        eta = (self.num_steps - i) / speed
-        LOG.info(
-            "Done %s out of %s in %s (%sh), ETA: %s.",
-            i + 1,
-            self.num_steps,
-            seconds(now - self.last),
-            step,
-            seconds(eta),
-        )
+        now = time.monotonic()
+        if LOG.isEnabledFor(logging.INFO):
+            elapsed = now - self.start
+            speed = (i + 1) / elapsed
+            eta = (self.num_steps - i) / speed
+            LOG.info(
+                "Done %s out of %s in %s (%sh), ETA: %s.",
+                i + 1,
+                self.num_steps,
+                seconds(now - self.last),
+                step,
+                seconds(eta),
+            )
         self.last = now
 
     def __exit__(self, *args):
         if self.num_steps == 0:
             return
 
-        elapsed = time.time() - self.start
+        elapsed = time.monotonic() - self.start
         LOG.info("Elapsed: %s.", seconds(elapsed))
         LOG.info("Average: %s per step.", seconds(elapsed / self.num_steps))
@@ -0,0 +1,34 @@
+# (C) Copyright 2023 European Centre for Medium-Range Weather Forecasts.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import logging
+import time
+
+LOG = logging.getLogger(__name__)
+
+
+class Timer:
+    __slots__ = ("title", "start")
+
+    def __init__(self, title):
+        self.title = title
+        self.start = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        # Options such as --version exit before logging is configured,
+        # so we avoid loading earthkit just to format a discarded message
+        if not LOG.isEnabledFor(logging.INFO):
+            return
+
+        # Imported here so that the CLI can start without loading earthkit
+        from earthkit.data.utils.humanize import seconds
+
+        elapsed = time.monotonic() - self.start
+        LOG.info("%s: %s.", self.title, seconds(elapsed))
@@ -0,0 +1,19 @@
+# (C) Copyright 2024 European Centre for Medium-Range Weather Forecasts.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import pytest
+
+from ai_models.__main__ import _parse_metadata
+
+
+def test_parse_metadata():
+    assert _parse_metadata(["KEY=a=b", "class=od", "empty="]) == {"KEY": "a=b", "class": "od", "empty": ""}
+
+
+def test_parse_metadata_error():
+    with pytest.raises(ValueError):
+        _parse_metadata(["KEY"])
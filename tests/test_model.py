@@ -0,0 +1,47 @@
+# (C) Copyright 2024 European Centre for Medium-Range Weather Forecasts.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import numpy as np
+
+from ai_models.model import Model
+
+
+class Writer:
+    def submit(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+class ArrayLike:
+    # Like a torch CPU tensor, shares its memory with numpy
+    def __init__(self, array):
+        self.array = array
+
+    def __array__(self, dtype=None, copy=None):
+        return self.array
+
+
+def test_write_copies_arrays():
+    model = Model.__new__(Model)
+    model.writer = Writer()
+
+    values = np.zeros(4)
+    data = np.zeros(4)
+    tensor = ArrayLike(np.zeros(4))
+
+    model.write(values, template="template", data=data, other=tensor, step=6)
+
+    values[:] = 1
+    data[:] = 1
+    tensor.array[:] = 1
+
+    (written,) = model.writer.args
+    assert np.all(written == 0)
+    assert np.all(model.writer.kwargs["data"] == 0)
+    assert np.all(model.writer.kwargs["other"] == 0)
+    assert model.writer.kwargs["template"] == "template"
+    assert model.writer.kwargs["step"] == 6
@@ -0,0 +1,49 @@
+# (C) Copyright 2024 European Centre for Medium-Range Weather Forecasts.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import time
+
+import pytest
+
+from ai_models.outputs import BackgroundWriter
+
+
+def test_background_writer_order():
+    written = []
+    writer = BackgroundWriter(lambda *args, **kwargs: written.append((args, kwargs)), maxsize=2)
+    for i in range(20):
+        writer.submit(i, step=i)
+    writer.close()
+
+    assert written == [((i,), dict(step=i)) for i in range(20)]
+
+
+def _fail(*args, **kwargs):
+    raise RuntimeError("write failed")
+
+
+def test_background_writer_error_in_close():
+    writer = BackgroundWriter(_fail)
+    writer.submit(1)
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        writer.close()
+
+
+def test_background_writer_error_in_submit():
+    writer = BackgroundWriter(_fail)
+    writer.submit(1)
+
+    deadline = time.monotonic() + 10
+    while writer.error is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        writer.submit(2)
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        writer.close()
@@ -0,0 +1,19 @@
+# (C) Copyright 2024 European Centre for Medium-Range Weather Forecasts.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import numpy as np
+import pytest
+
+from ai_models.inputs.recenter import _roll
+
+
+@pytest.mark.parametrize("roll", [-720, -5, -1, 0, 1, 3])
+def test_roll(roll):
+    data = np.arange(3 * 1440, dtype=np.float32).reshape(3, 1440)
+    out = np.empty_like(data)
+
+    assert np.array_equal(_roll(data, roll, out), np.roll(data, roll, axis=1))